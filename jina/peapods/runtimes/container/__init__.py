@@ -1,10 +1,13 @@
 import argparse
+import atexit
 import os
 import sys
-import time
+import threading
 import warnings
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from platform import uname
+from typing import List, Optional
 
 from ..zmq.base import ZMQRuntime
 from ...zmq import Zmqlet
@@ -14,17 +17,26 @@ from ...zmq import send_ctrl_message
 from ....helper import ArgNamespace, slugify
 
 
+@lru_cache()
+def _get_pea_parser() -> 'argparse.ArgumentParser':
+    from ....parsers import set_pea_parser
+
+    return set_pea_parser()
+
+
 class ContainerRuntime(ZMQRuntime):
     """Runtime procedure for container."""
 
+    _docker_client = None
+    _docker_client_pid = None
+    _container_args = None
+
     def __init__(self, args: 'argparse.Namespace', ctrl_addr: str, **kwargs):
         super().__init__(args, ctrl_addr, **kwargs)
         self._set_network_for_dind_linux()
         self._docker_run()
-        while self._is_container_alive and not self.is_ready:
-            time.sleep(1)
-        # two cases to reach here: 1. is_ready, 2. container is dead
-        if not self._is_container_alive:
+        # two cases to return: 1. is_ready, 2. container is dead
+        if not self._wait_container_ready():
             # replay it to see the log
             self._docker_run(replay=True)
             raise Exception(
@@ -33,24 +45,106 @@ class ContainerRuntime(ZMQRuntime):
 
     def teardown(self):
         """Stop the container."""
-        self._container.stop()
+        self._get_docker_client().api.stop(self._container_id)
         super().teardown()
 
+    def _wait_container_ready(self) -> bool:
+        """
+        Block until the container is ready or dies.
+
+        The control socket is polled and the ``die`` event of the container is awaited in two background
+        threads, so a dead container is noticed even while a control request is still pending.
+
+        :return: True if the container is ready, False if it died
+        """
+        is_done = threading.Event()
+        is_dead = threading.Event()
+        # only the arrival of an event matters, the daemon already filters for `die`,
+        # so the payload is never JSON-decoded
+        events = self._get_docker_client().events(
+            decode=False, filters={'container': self._container_id, 'event': 'die'}
+        )
+
+        def _wait_dead():
+            try:
+                for _ in events:
+                    is_dead.set()
+                    is_done.set()
+                    break
+            except Exception:
+                # the stream is closed once the container is ready
+                pass
+
+        def _poll_ready():
+            while not is_done.is_set():
+                if self.is_ready:
+                    is_done.set()
+                else:
+                    # a control request already blocks up to `timeout-ctrl` while nothing listens,
+                    # this only throttles fast negative answers
+                    is_done.wait(1)
+
+        threading.Thread(target=_wait_dead, daemon=True).start()
+        # the container may have died before the subscription starts
+        if not self._is_container_alive:
+            is_dead.set()
+            is_done.set()
+        else:
+            threading.Thread(target=_poll_ready, daemon=True).start()
+
+        try:
+            is_done.wait()
+        finally:
+            is_done.set()
+            events.close()
+        return not is_dead.is_set()
+
     def _stream_logs(self):
-        for line in self._container.logs(stream=True):
-            self.logger.info(line.strip().decode())
+        import docker
+
+        try:
+            for line in self._get_docker_client().api.logs(
+                self._container_id, stream=True
+            ):
+                self.logger.info(line.strip().decode())
+        except docker.errors.APIError as ex:
+            # an auto-removed container may be gone before its logs are read
+            self.logger.warning(
+                f'can not stream the logs of container {self._container_id}: {ex!r}'
+            )
 
     def run_forever(self):
         """Stream the logs while running."""
         self.is_ready_event.set()
         self._stream_logs()
 
-    def _set_network_for_dind_linux(self):
+    @classmethod
+    def _get_docker_client(cls):
+        """
+        Get the docker client of the current process, create it on the first call.
+
+        The client is never shared across processes: a forked child would otherwise inherit
+        the parent's connection pool, so it is rebuilt whenever the pid changes.
+
+        :return: the docker client
+        """
         import docker
 
-        # recompute the control_addr, do not assign client, since this would be an expensive object to
-        # copy in the new process generated
-        client = docker.from_env()
+        if cls._docker_client is None or cls._docker_client_pid != os.getpid():
+            cls._docker_client = docker.from_env()
+            cls._docker_client_pid = os.getpid()
+        return cls._docker_client
+
+    @classmethod
+    def _close_docker_client(cls):
+        if cls._docker_client is not None and cls._docker_client_pid == os.getpid():
+            cls._docker_client.close()
+        cls._docker_client = None
+        cls._docker_client_pid = None
+
+    def _set_network_for_dind_linux(self):
+        # recompute the control_addr
+        client = self._get_docker_client()
 
         # Related to potential docker-in-docker communication. If `ContainerPea` lives already inside a container.
         # it will need to communicate using the `bridge` network.
@@ -72,14 +166,47 @@ class ContainerRuntime(ZMQRuntime):
                     f'Unable to set control address from "bridge" network: {ex!r}'
                     f' Control address set to {self.ctrl_addr}'
                 )
-        client.close()
+
+    def _pull_image(self, uses_img: str, platform: Optional[str] = None):
+        import docker
+
+        self.logger.warning(
+            f'pulling {uses_img}, this could take a while. if you encounter '
+            f'timeout error due to pulling takes to long, then please set '
+            f'"timeout-ready" to a larger value.'
+        )
+        try:
+            self._get_docker_client().images.pull(uses_img, platform=platform)
+        except docker.errors.NotFound:
+            self.logger.error(f'can not find remote image: {uses_img}')
+            raise BadImageNameError(f'image: {uses_img} can not be found remote.')
+
+    def _get_container_args(self) -> List[str]:
+        # computed once, the replay after a failed start reuses the same args
+        if self._container_args is None:
+            # the image arg should be ignored otherwise it keeps using ContainerPea in the container
+            # basically all args in BasePea-docker arg group should be ignored.
+            # this prevent setting containerPea twice
+            self.args.runs_in_docker = True
+            non_defaults = ArgNamespace.get_non_defaults_args(
+                self.args,
+                _get_pea_parser(),
+                taboo={
+                    'uses',
+                    'entrypoint',
+                    'volumes',
+                    'pull_latest',
+                    'runtime_cls',
+                    'docker_kwargs',
+                },
+            )
+            self._container_args = ArgNamespace.kwargs2list(non_defaults)
+        return self._container_args
 
     def _docker_run(self, replay: bool = False):
-        # important to notice, that client is not assigned as instance member to avoid potential
-        # heavy copy into new process memory space
         import docker
 
-        client = docker.from_env()
+        client = self._get_docker_client()
 
         if self.args.uses.startswith('docker://'):
             uses_img = self.args.uses.replace('docker://', '')
@@ -91,97 +218,91 @@ class ContainerRuntime(ZMQRuntime):
             )
             uses_img = self.args.uses
 
-        # the image arg should be ignored otherwise it keeps using ContainerPea in the container
-        # basically all args in BasePea-docker arg group should be ignored.
-        # this prevent setting containerPea twice
-        from ....parsers import set_pea_parser
-
-        self.args.runs_in_docker = True
-        non_defaults = ArgNamespace.get_non_defaults_args(
-            self.args,
-            set_pea_parser(),
-            taboo={
-                'uses',
-                'entrypoint',
-                'volumes',
-                'pull_latest',
-                'runtime_cls',
-                'docker_kwargs',
-            },
-        )
-
-        img_not_found = False
+        pull_future = None
+        if self.args.pull_latest:
+            # pulling can take long, prepare the run arguments meanwhile
+            executor = ThreadPoolExecutor(max_workers=1)
+            pull_future = executor.submit(
+                self._pull_image,
+                uses_img,
+                (self.args.docker_kwargs or {}).get('platform'),
+            )
+            executor.shutdown(wait=False)
 
         try:
-            client.images.get(uses_img)
-        except docker.errors.ImageNotFound:
-            self.logger.error(f'can not find local image: {uses_img}')
-            img_not_found = True
+            _volumes = {}
+            if self.args.volumes:
+                for p in self.args.volumes:
+                    paths = p.split(':')
+                    local_path = os.path.abspath(paths[0])
+                    if not os.path.isdir(local_path):
+                        os.makedirs(local_path, exist_ok=True)
+                    if len(paths) == 2:
+                        container_path = paths[1]
+                    else:
+                        container_path = '/' + os.path.basename(p)
+                    _volumes[local_path] = {
+                        'bind': container_path,
+                        'mode': 'rw',
+                    }
+
+            _expose_port = [self.args.port_ctrl]
+            if self.args.socket_in.is_bind:
+                _expose_port.append(self.args.port_in)
+            if self.args.socket_out.is_bind:
+                _expose_port.append(self.args.port_out)
+
+            _args = self._get_container_args()
+            ports = (
+                {f'{v}/tcp': v for v in _expose_port} if not self._net_mode else None
+            )
 
-        if self.args.pull_latest or img_not_found:
-            self.logger.warning(
-                f'pulling {uses_img}, this could take a while. if you encounter '
-                f'timeout error due to pulling takes to long, then please set '
-                f'"timeout-ready" to a larger value.'
+            docker_kwargs = self.args.docker_kwargs or {}
+        finally:
+            # surface a failed pull rather than any error of the preparation,
+            # and never leave the pull running unobserved
+            if pull_future is not None:
+                pull_future.result()
+
+        if pull_future is None:
+            self.logger.info(
+                f'{uses_img} is pulled if it is not found locally, if this times out '
+                f'then please set "timeout-ready" to a larger value.'
             )
-            try:
-                client.images.pull(uses_img)
-                img_not_found = False
-            except docker.errors.NotFound:
-                img_not_found = True
-                self.logger.error(f'can not find remote image: {uses_img}')
-
-        if img_not_found:
-            raise BadImageNameError(
-                f'image: {uses_img} can not be found local & remote.'
+        try:
+            # a missing local image is pulled by `containers.run` itself
+            container = client.containers.run(
+                uses_img,
+                _args,
+                detach=True,
+                auto_remove=True,
+                ports=ports,
+                name=slugify(self.name),
+                volumes=_volumes,
+                network_mode=self._net_mode,
+                entrypoint=self.args.entrypoint,
+                extra_hosts={__docker_host__: 'host-gateway'},
+                **docker_kwargs,
             )
-
-        _volumes = {}
-        if self.args.volumes:
-            for p in self.args.volumes:
-                paths = p.split(':')
-                local_path = paths[0]
-                Path(os.path.abspath(local_path)).mkdir(parents=True, exist_ok=True)
-                if len(paths) == 2:
-                    container_path = paths[1]
-                else:
-                    container_path = '/' + os.path.basename(p)
-                _volumes[os.path.abspath(local_path)] = {
-                    'bind': container_path,
-                    'mode': 'rw',
-                }
-
-        _expose_port = [self.args.port_ctrl]
-        if self.args.socket_in.is_bind:
-            _expose_port.append(self.args.port_in)
-        if self.args.socket_out.is_bind:
-            _expose_port.append(self.args.port_out)
-
-        _args = ArgNamespace.kwargs2list(non_defaults)
-        ports = {f'{v}/tcp': v for v in _expose_port} if not self._net_mode else None
-
-        docker_kwargs = self.args.docker_kwargs or {}
-        self._container = client.containers.run(
-            uses_img,
-            _args,
-            detach=True,
-            auto_remove=True,
-            ports=ports,
-            name=slugify(self.name),
-            volumes=_volumes,
-            network_mode=self._net_mode,
-            entrypoint=self.args.entrypoint,
-            extra_hosts={__docker_host__: 'host-gateway'},
-            **docker_kwargs,
-        )
+        except docker.errors.NotFound as ex:
+            # the pull inside `containers.run` reports a missing remote image as a plain
+            # `NotFound`, only look up the image when something was not found
+            try:
+                client.images.get(uses_img)
+            except docker.errors.ImageNotFound:
+                self.logger.error(f'can not find local & remote image: {uses_img}')
+                raise BadImageNameError(
+                    f'image: {uses_img} can not be found local & remote.'
+                ) from ex
+            raise
+        # only the id is kept, the rest of the runtime talks to the low-level API
+        self._container_id = container.id
 
         if replay:
             # when replay is on, it means last time it fails to start
             # therefore we know the loop below wont block the main process
             self._stream_logs()
 
-        client.close()
-
     @property
     def status(self):
         """
@@ -207,8 +328,12 @@ class ContainerRuntime(ZMQRuntime):
     def _is_container_alive(self) -> bool:
         import docker.errors
 
+        client = self._get_docker_client()
         try:
-            self._container.reload()
+            state = client.api.inspect_container(self._container_id)['State']
         except docker.errors.NotFound:
             return False
-        return True
+        return state.get('Status') not in ('exited', 'dead')
+
+
+atexit.register(ContainerRuntime._close_docker_client)
@@ -14,12 +14,12 @@ __all__ = ['GRPCRuntime']
 class GRPCPrefetchCall(PrefetchMixin, jina_pb2_grpc.JinaRPCServicer):
     """JinaRPCServicer """
 
-    def __init__(self, args, zmqlet):
+    def __init__(self, args, zmqlet, logger=None):
         super().__init__()
         self.args = args
         self.zmqlet = zmqlet
         self.name = args.name or self.__class__.__name__
-        self.logger = JinaLogger(self.name, **vars(args))
+        self.logger = logger or JinaLogger(self.name, **vars(args))
 
 
 class GRPCRuntime(AsyncNewLoopRuntime):
@@ -43,7 +43,7 @@ class GRPCRuntime(AsyncNewLoopRuntime):
         )
         self.zmqlet = AsyncZmqlet(self.args, logger=self.logger)
         jina_pb2_grpc.add_JinaRPCServicer_to_server(
-            GRPCPrefetchCall(self.args, self.zmqlet), self.server
+            GRPCPrefetchCall(self.args, self.zmqlet, self.logger), self.server
         )
         bind_addr = f'{self.args.host}:{self.args.port_expose}'
         self.server.add_insecure_port(bind_addr)
@@ -58,7 +58,7 @@ def get_fastapi_app(args: 'argparse.Namespace', logger: 'JinaLogger'):
         )
 
     zmqlet = AsyncZmqlet(args, logger)
-    servicer = PrefetchCaller(args, zmqlet)
+    servicer = PrefetchCaller(args, zmqlet, logger)
 
     @app.on_event('shutdown')
     def _shutdown():
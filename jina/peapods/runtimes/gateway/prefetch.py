@@ -1,7 +1,7 @@
 import argparse
 import asyncio
 from abc import ABC
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from ....helper import typename
 from ....logging.logger import JinaLogger
@@ -11,11 +11,20 @@ __all__ = ['PrefetchCaller', 'PrefetchMixin']
 
 if False:
     from ...zmq import AsyncZmqlet
+    from ....types.request import Request
+
+
+def _get_response(msg: 'Message') -> 'Request':
+    return msg.response
 
 
 class PrefetchMixin(ABC):
     """JinaRPCServicer """
 
+    args: argparse.Namespace
+    zmqlet: 'AsyncZmqlet'
+    logger: JinaLogger
+
     async def Call(self, request_iterator, *args) -> AsyncGenerator[None, Message]:
         """
         Async call to receive Requests and build them into Messages.
@@ -24,45 +33,57 @@ class PrefetchMixin(ABC):
         :param args: additional arguments
         :yield: message
         """
-        self.args: argparse.Namespace
-        self.zmqlet: 'AsyncZmqlet'
-        self.logger: JinaLogger
+        # resolved once per stream instead of once per request
+        msg_kwargs = vars(self.args)
+        send_message = self.zmqlet.send_message
+        recv_message = self.zmqlet.recv_message
+        if hasattr(request_iterator, '__anext__'):
+            next_request_fn = request_iterator.__anext__
+            is_async_iterator = True
+        elif hasattr(request_iterator, '__next__'):
+            next_request_fn = request_iterator.__next__
+            is_async_iterator = False
+        else:
+            raise TypeError(
+                f'{typename(request_iterator)} does not have `__anext__` or `__next__`'
+            )
+
+        # every receiving task puts itself into this queue once done, in the order of completion
+        done_queue = asyncio.Queue()
+        num_pending = 0
 
-        async def prefetch_req(num_req, fetch_to):
+        async def prefetch_req(num_req):
             """
             Fetch and send request.
 
             :param num_req: number of requests
-            :param fetch_to: the task list storing requests
-            :return: False if append task to :param:`fetch_to` else False
+            :return: True if the request iterator is exhausted else False
             """
+            nonlocal num_pending
             for _ in range(num_req):
                 try:
-                    if hasattr(request_iterator, '__anext__'):
-                        next_request = await request_iterator.__anext__()
-                    elif hasattr(request_iterator, '__next__'):
-                        next_request = next(request_iterator)
+                    if is_async_iterator:
+                        next_request = await next_request_fn()
                     else:
-                        raise TypeError(
-                            f'{typename(request_iterator)} does not have `__anext__` or `__next__`'
-                        )
-                    asyncio.create_task(
-                        self.zmqlet.send_message(
-                            Message(None, next_request, 'gateway', **vars(self.args))
-                        )
+                        next_request = next_request_fn()
+                    # `send_message` only schedules the sending task, so await it directly
+                    # rather than wrapping it in one more task per request
+                    await send_message(
+                        Message(None, next_request, 'gateway', **msg_kwargs)
                     )
-                    fetch_to.append(
-                        asyncio.create_task(
-                            self.zmqlet.recv_message(callback=lambda x: x.response)
-                        )
+                    # responses on the shared socket are not matched to a stream, every sent request
+                    # keeps its receiving task even if the stream is closed early, its result is discarded
+                    recv_task = asyncio.create_task(
+                        recv_message(callback=_get_response)
                     )
+                    recv_task.add_done_callback(done_queue.put_nowait)
+                    num_pending += 1
                 except (StopIteration, StopAsyncIteration):
                     return True
             return False
 
-        prefetch_task = []
-        is_req_empty = await prefetch_req(self.args.prefetch, prefetch_task)
-        if is_req_empty and not prefetch_task:
+        is_req_empty = await prefetch_req(self.args.prefetch)
+        if is_req_empty and not num_pending:
             self.logger.error(
                 'receive an empty stream from the client! '
                 'please check your client\'s inputs, '
@@ -70,44 +91,41 @@ class PrefetchMixin(ABC):
             )
             return
 
-        # the total num requests < self.args.prefetch
-        if is_req_empty:
-            for r in asyncio.as_completed(prefetch_task):
-                yield await r
-        else:
-            # if there are left over (`else` clause above is unnecessary for code but for better readability)
-            onrecv_task = []
-            # the following code "interleaves" prefetch_task and onrecv_task, when one dries, it switches to the other
-            while prefetch_task:
+        num_recv = 0
+        while num_pending:
+            # while still fetching, report the progress once per `prefetch` responses
+            if not is_req_empty and num_recv % self.args.prefetch == 0:
                 self.logger.debug(
                     f'send: {self.zmqlet.msg_sent} '
                     f'recv: {self.zmqlet.msg_recv} '
                     f'pending: {self.zmqlet.msg_sent - self.zmqlet.msg_recv}'
                 )
-                onrecv_task.clear()
-                for r in asyncio.as_completed(prefetch_task):
-                    yield await r
-                    if not is_req_empty:
-                        is_req_empty = await prefetch_req(
-                            self.args.prefetch_on_recv, onrecv_task
-                        )
-
-                # this list dries, clear it and feed it with on_recv_task
-                prefetch_task.clear()
-                prefetch_task = [j for j in onrecv_task]
+            recv_task = await done_queue.get()
+            num_pending -= 1
+            num_recv += 1
+            yield recv_task.result()
+            # the total num requests may be less than self.args.prefetch, then nothing left to fetch
+            if not is_req_empty:
+                is_req_empty = await prefetch_req(self.args.prefetch_on_recv)
 
 
 class PrefetchCaller(PrefetchMixin):
     """An async zmq request sender to be used in the Gateway"""
 
-    def __init__(self, args: argparse.Namespace, zmqlet: 'AsyncZmqlet'):
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        zmqlet: 'AsyncZmqlet',
+        logger: Optional[JinaLogger] = None,
+    ):
         """
 
         :param args: args from CLI
         :param zmqlet: zeromq object
+        :param logger: the logger of the gateway runtime, a new one is built from ``args`` if not given
         """
         super().__init__()
         self.args = args
         self.zmqlet = zmqlet
         self.name = args.name or self.__class__.__name__
-        self.logger = JinaLogger(self.name, **vars(args))
+        self.logger = logger or JinaLogger(self.name, **vars(args))
@@ -36,7 +36,7 @@ def get_fastapi_app(args: 'argparse.Namespace', logger: 'JinaLogger'):
     app = FastAPI()
 
     zmqlet = AsyncZmqlet(args, logger)
-    servicer = PrefetchCaller(args, zmqlet)
+    servicer = PrefetchCaller(args, zmqlet, logger)
 
     @app.on_event('shutdown')
     def _shutdown():
@@ -6,6 +6,7 @@ import multiprocessing
 import pytest
 
 from jina.checker import NetworkChecker
+from jina.excepts import BadImageNameError
 from jina.executors import BaseExecutor
 from jina.executors.decorators import requests
 from jina import Flow
@@ -213,57 +214,26 @@ def test_tail_host_docker2local():
         assert getattr(f._pod_nodes['d12'].tail_args, 'host_out') == localhost
 
 
-def test_pass_arbitrary_kwargs(monkeypatch, mocker):
+@pytest.fixture
+def mock_docker_client(monkeypatch, mocker):
     import docker
 
-    mock = mocker.Mock()
+    client = mocker.MagicMock()
+    client.networks.get.return_value = None
+    client.containers.run.return_value.id = 'mock-container'
+    client.api.inspect_container.return_value = {'State': {'Status': 'running'}}
+    client.api.logs.return_value = []
+    monkeypatch.setattr(docker, 'from_env', lambda: client)
+    monkeypatch.setattr(ContainerRuntime, '_docker_client', None)
+    return client
+
+
+def test_pass_arbitrary_kwargs(mock_docker_client, mocker):
     mocker.patch(
         'jina.peapods.runtimes.container.ContainerRuntime.is_ready',
+        new_callable=mocker.PropertyMock,
         return_value=True,
     )
-
-    class MockContainers:
-        class MockContainer:
-            def reload(self):
-                pass
-
-            def logs(self, **kwargs):
-                return []
-
-        def __init__(self):
-            pass
-
-        def run(self, *args, **kwargs):
-            mock_kwargs = {k: kwargs[k] for k in ['hello', 'ports', 'environment']}
-            mock(**mock_kwargs)
-            assert 'ports' in kwargs
-            assert kwargs['ports'] is None
-            assert 'environment' in kwargs
-            assert kwargs['environment'] == ['VAR1=BAR', 'VAR2=FOO']
-            assert 'hello' in kwargs
-            assert kwargs['hello'] == 0
-            return MockContainers.MockContainer()
-
-    class MockClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def close(self):
-            pass
-
-        @property
-        def networks(self):
-            return {'bridge': None}
-
-        @property
-        def containers(self):
-            return MockContainers()
-
-        @property
-        def images(self):
-            return {}
-
-    monkeypatch.setattr(docker, 'from_env', MockClient)
     args = set_pea_parser().parse_args(
         [
             '--uses',
@@ -271,11 +241,127 @@ def test_pass_arbitrary_kwargs(monkeypatch, mocker):
             '--docker-kwargs',
             'hello: 0',
             'environment: ["VAR1=BAR", "VAR2=FOO"]',
+            'platform: linux/amd64',
         ]
     )
     _ = ContainerRuntime(args, ctrl_addr='', ready_event=multiprocessing.Event())
-    expected_args = {'hello': 0, 'ports': None, 'environment': ['VAR1=BAR', 'VAR2=FOO']}
-    mock.assert_called_with(**expected_args)
+    run_kwargs = mock_docker_client.containers.run.call_args.kwargs
+    assert run_kwargs['ports'] is None
+    assert run_kwargs['hello'] == 0
+    assert run_kwargs['environment'] == ['VAR1=BAR', 'VAR2=FOO']
+    # `platform` is only understood by `containers.run`, not by container creation
+    assert run_kwargs['platform'] == 'linux/amd64'
+
+
+def test_pull_latest_with_platform(mock_docker_client, mocker):
+    mocker.patch(
+        'jina.peapods.runtimes.container.ContainerRuntime.is_ready',
+        new_callable=mocker.PropertyMock,
+        return_value=True,
+    )
+    args = set_pea_parser().parse_args(
+        [
+            '--uses',
+            'docker://jinahub/pod',
+            '--pull-latest',
+            '--docker-kwargs',
+            'platform: linux/arm64',
+        ]
+    )
+    _ = ContainerRuntime(args, ctrl_addr='', ready_event=multiprocessing.Event())
+    mock_docker_client.images.pull.assert_called_once_with(
+        'jinahub/pod', platform='linux/arm64'
+    )
+
+
+@pytest.mark.parametrize('pull_fails', [False, True])
+def test_pull_latest_awaited_on_preparation_error(
+    mock_docker_client, mocker, pull_fails
+):
+    import docker
+
+    if pull_fails:
+        mock_docker_client.images.pull.side_effect = docker.errors.NotFound('missing')
+    mocker.patch(
+        'jina.peapods.runtimes.container.ContainerRuntime._get_container_args',
+        side_effect=ValueError('bad args'),
+    )
+    args = set_pea_parser().parse_args(
+        ['--uses', 'docker://jinahub/pod', '--pull-latest']
+    )
+    with pytest.raises(BadImageNameError if pull_fails else ValueError):
+        ContainerRuntime(args, ctrl_addr='', ready_event=multiprocessing.Event())
+    mock_docker_client.images.pull.assert_called_once()
+    mock_docker_client.containers.run.assert_not_called()
+
+
+def test_container_dies_before_ready(mock_docker_client, mocker):
+    mocker.patch(
+        'jina.peapods.runtimes.container.ContainerRuntime.is_ready',
+        new_callable=mocker.PropertyMock,
+        return_value=False,
+    )
+    mock_docker_client.events.return_value.__iter__.return_value = iter([b'die'])
+    args = set_pea_parser().parse_args(['--uses', 'docker://jinahub/pod'])
+    with pytest.raises(Exception, match='the container fails to start'):
+        ContainerRuntime(args, ctrl_addr='', ready_event=multiprocessing.Event())
+    # the container is run again to replay its logs
+    assert mock_docker_client.containers.run.call_count == 2
+    mock_docker_client.events.return_value.close.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'run_error',
+    [
+        # raised by the pull `containers.run` does when the image is not local
+        lambda docker: docker.errors.NotFound('manifest unknown'),
+        lambda docker: docker.errors.ImageNotFound('no such image'),
+    ],
+)
+def test_image_not_found(mock_docker_client, run_error):
+    import docker
+
+    mock_docker_client.containers.run.side_effect = run_error(docker)
+    mock_docker_client.images.get.side_effect = docker.errors.ImageNotFound(
+        'no such image'
+    )
+    args = set_pea_parser().parse_args(['--uses', 'docker://jinahub/not-exist'])
+    with pytest.raises(BadImageNameError):
+        ContainerRuntime(args, ctrl_addr='', ready_event=multiprocessing.Event())
+
+
+def test_run_not_found_for_existing_image(mock_docker_client):
+    import docker
+
+    mock_docker_client.containers.run.side_effect = docker.errors.NotFound(
+        'network not found'
+    )
+    args = set_pea_parser().parse_args(['--uses', 'docker://jinahub/pod'])
+    with pytest.raises(docker.errors.NotFound):
+        ContainerRuntime(args, ctrl_addr='', ready_event=multiprocessing.Event())
+
+
+@pytest.mark.parametrize('container_gone', [False, True])
+def test_stream_logs(mock_docker_client, mocker, container_gone):
+    import docker
+
+    if container_gone:
+        mock_docker_client.api.logs.side_effect = docker.errors.APIError('gone')
+    else:
+        mock_docker_client.api.logs.return_value = [b'hello\n', b'world\n']
+    runtime = ContainerRuntime.__new__(ContainerRuntime)
+    runtime._container_id = 'mock-container'
+    runtime.logger = mocker.MagicMock()
+
+    runtime._stream_logs()
+    if container_gone:
+        runtime.logger.info.assert_not_called()
+        runtime.logger.warning.assert_called_once()
+    else:
+        assert runtime.logger.info.call_args_list == [
+            mocker.call('hello'),
+            mocker.call('world'),
+        ]
 
 
 def test_pass_arbitrary_kwargs_from_yaml():
@@ -333,3 +419,22 @@ def test_container_volume(docker_image_built, tmpdir):
     assert os.path.exists(
         os.path.join(abc_path, 'ext-mwu-encoder', '0', 'ext-mwu-encoder.bin')
     )
+
+
+def test_container_args_computed_once(mocker):
+    from jina.helper import ArgNamespace
+
+    spy = mocker.spy(ArgNamespace, 'kwargs2list')
+    args = set_pea_parser().parse_args(
+        ['--uses', 'docker://jinahub/pod', '--pull-latest', '--entrypoint', 'jina pea']
+    )
+    runtime = ContainerRuntime.__new__(ContainerRuntime)
+    runtime.args = args
+
+    container_args = runtime._get_container_args()
+    # the replay after a failed start reuses the serialized args
+    assert runtime._get_container_args() is container_args
+    assert spy.call_count == 1
+    assert '--runs-in-docker' in container_args
+    for taboo in ('--uses', '--pull-latest', '--entrypoint'):
+        assert taboo not in container_args
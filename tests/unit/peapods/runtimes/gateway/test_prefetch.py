@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from jina import Document
+from jina.clients.request import request_generator
+from jina.parsers import set_gateway_parser
+from jina.peapods.runtimes.gateway.prefetch import PrefetchCaller
+
+
+class _FakeZmqlet:
+    """Reply to every sent message after its own delay, in the order the replies are ready."""
+
+    def __init__(self, delays):
+        self.msg_sent = 0
+        self.msg_recv = 0
+        self.num_in_flight = 0
+        self.max_in_flight = 0
+        self._delays = iter(delays)
+        self._replies = asyncio.Queue()
+
+    async def send_message(self, msg):
+        self.msg_sent += 1
+        self.num_in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.num_in_flight)
+        asyncio.get_event_loop().call_later(
+            next(self._delays), self._replies.put_nowait, msg
+        )
+
+    async def recv_message(self, callback=None):
+        msg = await self._replies.get()
+        self.msg_recv += 1
+        self.num_in_flight -= 1
+        return callback(msg)
+
+
+def _get_caller(mocker, delays, *args):
+    args = set_gateway_parser().parse_args(list(args))
+    return PrefetchCaller(args, _FakeZmqlet(delays), logger=mocker.MagicMock())
+
+
+def _get_requests(num_requests):
+    return list(
+        request_generator('/index', [Document() for _ in range(num_requests)], 1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_yields_in_completion_order(mocker):
+    caller = _get_caller(mocker, [0.2, 0.1, 0.0])
+    requests = _get_requests(3)
+
+    responses = [r async for r in caller.Call(iter(requests))]
+    assert [r.request_id for r in responses] == [
+        r.request_id for r in reversed(requests)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_tops_up_on_recv(mocker):
+    caller = _get_caller(
+        mocker, [0.01] * 10, '--prefetch', '3', '--prefetch-on-recv', '1'
+    )
+    requests = _get_requests(10)
+
+    responses = [r async for r in caller.Call(iter(requests))]
+    assert caller.zmqlet.max_in_flight <= 3
+    assert sorted(r.request_id for r in responses) == sorted(
+        r.request_id for r in requests
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_empty_stream(mocker):
+    caller = _get_caller(mocker, [])
+
+    responses = [r async for r in caller.Call(iter([]))]
+    assert not responses
+    caller.logger.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_next_stream_after_early_close(mocker):
+    caller = _get_caller(
+        mocker, [0.0, 0.05, 0.05, 0.1], '--prefetch', '3', '--prefetch-on-recv', '1'
+    )
+    call = caller.Call(iter(_get_requests(3)))
+    await call.__anext__()
+    await call.aclose()
+
+    # a second stream on the same zmqlet, e.g. the next websocket client
+    next_caller = PrefetchCaller(caller.args, caller.zmqlet, logger=mocker.MagicMock())
+    next_requests = _get_requests(1)
+    responses = [r async for r in next_caller.Call(iter(next_requests))]
+    assert [r.request_id for r in responses] == [next_requests[0].request_id]